@@ -270,15 +270,19 @@ def print_validation_errors(exception: pydantic.ValidationError):
     # some locations are not really the locations in the input file, but some
     # information about the model coming from Pydantic. We need to remove them.
     # (e.g. avoid stuff like .end_date.literal['present'])
-    unwanted_locations = ["tagged-union", "list", "literal", "int", "constrained-str"]
+    unwanted_locations = ("tagged-union", "list", "literal", "int", "constrained-str")
     for error_object in errors:
-        location = [str(location_element) for location_element in error_object["loc"]]
-        new_location = [str(location_element) for location_element in location]
-        for location_element in location:
-            for unwanted_location in unwanted_locations:
-                if unwanted_location in location_element:
-                    new_location.remove(location_element)
-        error_object["loc"] = new_location  # type: ignore
+        # Filter the locations in a single pass. Removing them from the list while
+        # looping would fail if a location contains more than one unwanted word (e.g.,
+        # list[int]):
+        error_object["loc"] = [  # type: ignore
+            location_element
+            for location_element in map(str, error_object["loc"])
+            if not any(
+                unwanted_location in location_element
+                for unwanted_location in unwanted_locations
+            )
+        ]
 
     # Parse all the errors and create a new list of errors.
     new_errors: list[dict[str, str]] = []
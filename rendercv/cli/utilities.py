@@ -10,7 +10,6 @@ import re
 import shutil
 import sys
 import time
-import urllib.request
 from collections.abc import Callable
 from typing import Any, Optional
 
@@ -134,10 +133,15 @@ def get_latest_version_number_from_pypi() -> Optional[str]:
         The latest version number of RenderCV from PyPI. Returns None if the version
         number cannot be fetched.
     """
+    # It is only needed here, so it is imported here to keep the CLI startup fast:
+    import urllib.request
+
     version = None
     url = "https://pypi.org/pypi/rendercv/json"
     try:
-        with urllib.request.urlopen(url) as response:
+        # This is called at the beginning of each render, so don't let a slow network
+        # block rendering for long. If it times out, the check is skipped:
+        with urllib.request.urlopen(url, timeout=2) as response:
             data = response.read()
             encoding = response.info().get_content_charset("utf-8")
             json_data = json.loads(data.decode(encoding))
@@ -3,9 +3,49 @@ The `rendercv.data.models.base` module contains the parent classes of all the da
 models in RenderCV.
 """
 
+import functools
+from typing import Any
+
 import pydantic
 
 
+@functools.cache
+def get_cached_property_names(model: type) -> tuple[str, ...]:
+    """Get the names of the `functools.cached_property` attributes of a class,
+    including the inherited ones.
+
+    Args:
+        model: The class to get its cached property names.
+
+    Returns:
+        The names of the cached properties.
+    """
+    return tuple(
+        {
+            name
+            for cls in model.__mro__
+            for name, attribute in vars(cls).items()
+            if isinstance(attribute, functools.cached_property)
+        }
+    )
+
+
+class ModelWithCachedProperties:
+    """This class is the parent class of the data models that cache their computed
+    values (like `date_string` or `sections`) with `functools.cached_property`. The
+    cached values are stored in the instance's `__dict__`, so they would go stale if a
+    field was updated later (e.g., while converting the Markdown fields to $\\LaTeX$).
+    This class drops the cached values whenever a field is assigned. The other data
+    models don't inherit from it, so their fields are assigned without this overhead.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        for cached_property_name in get_cached_property_names(type(self)):
+            vars(self).pop(cached_property_name, None)
+
+
 class RenderCVBaseModelWithoutExtraKeys(pydantic.BaseModel):
     """This class is the parent class of the data models that do not allow extra keys.
     It has only one difference from the default `pydantic.BaseModel`: It raises an error
@@ -4,8 +4,8 @@ properties based on the input data. For example, it includes functions that calc
 the time span between two dates, the date string, the URL of a social network, etc.
 """
 
+import functools
 import pathlib
-import re
 from datetime import date as Date
 from typing import Optional
 
@@ -63,27 +63,54 @@ def format_date(date: Date, date_style: Optional[str] = None) -> str:
     Returns:
         The formatted date.
     """
-    full_month_names = LOCALE_CATALOG["full_names_of_months"]
-    short_month_names = LOCALE_CATALOG["abbreviations_for_months"]
+    if date_style is None:
+        date_style = LOCALE_CATALOG["date_style"]  # type: ignore
 
-    month = int(date.strftime("%m"))
-    year = date.strftime(format="%Y")
+    assert isinstance(date_style, str)
+
+    # The month names are passed as tuples so that the result can be cached:
+    return format_date_with_month_names(
+        date,
+        date_style,
+        tuple(LOCALE_CATALOG["full_names_of_months"]),
+        tuple(LOCALE_CATALOG["abbreviations_for_months"]),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def format_date_with_month_names(
+    date: Date,
+    date_style: str,
+    full_month_names: tuple[str, ...],
+    short_month_names: tuple[str, ...],
+) -> str:
+    """Formats a `Date` object with the given date style and month names. The results
+    are cached because the same dates are formatted many times while rendering a CV
+    (e.g., the start and end dates of the entries and today's date).
+
+    Args:
+        date: The date to format.
+        date_style: The style of the date string.
+        full_month_names: The full names of the months.
+        short_month_names: The abbreviations of the months.
+
+    Returns:
+        The formatted date.
+    """
+    month = date.month
+    year = str(date.year)
 
     placeholders = {
         "FULL_MONTH_NAME": full_month_names[month - 1],
         "MONTH_ABBREVIATION": short_month_names[month - 1],
         "MONTH_IN_TWO_DIGITS": f"{month:02d}",
-        "YEAR_IN_TWO_DIGITS": str(year[-2:]),
+        "YEAR_IN_TWO_DIGITS": year[-2:],
         "MONTH": str(month),
-        "YEAR": str(year),
+        "YEAR": year,
     }
-    if date_style is None:
-        date_style = LOCALE_CATALOG["date_style"]  # type: ignore
-
-    assert isinstance(date_style, str)
 
     for placeholder, value in placeholders.items():
-        date_style = date_style.replace(placeholder, value)  # type: ignore
+        date_style = date_style.replace(placeholder, value)
 
     return date_style
 
@@ -94,8 +121,9 @@ def replace_placeholders(value: str) -> str:
     full_month_names = LOCALE_CATALOG["full_names_of_months"]
     short_month_names = LOCALE_CATALOG["abbreviations_for_months"]
 
-    month = Date.today().month
-    year = str(Date.today().year)
+    today = Date.today()
+    month = today.month
+    year = str(today.year)
 
     placeholders = {
         "NAME_IN_SNAKE_CASE": name.replace(" ", "_"),
@@ -188,15 +216,15 @@ def compute_time_span_string(
     end_date = get_date_object(end_date)  # type: ignore
     start_date = get_date_object(start_date)  # type: ignore
 
-    # Calculate the number of days between start_date and end_date:
-    timespan_in_days = (end_date - start_date).days  # type: ignore
+    # Calculate the number of days between start_date and end_date. The ordinals are
+    # subtracted directly instead of creating a `timedelta` object:
+    timespan_in_days = end_date.toordinal() - start_date.toordinal()  # type: ignore
 
     # Calculate the number of years and months between start_date and end_date:
-    how_many_years = timespan_in_days // 365
-    how_many_months = (timespan_in_days % 365) // 30 + 1
+    how_many_years, remaining_days = divmod(timespan_in_days, 365)
     # Deal with overflow (prevent rounding to 1 year 12 months, etc.)
-    how_many_years += how_many_months // 12
-    how_many_months %= 12
+    extra_years, how_many_months = divmod(remaining_days // 30 + 1, 12)
+    how_many_years += extra_years
 
     # Format the number of years and months between start_date and end_date:
     if how_many_years == 0:
@@ -214,20 +242,49 @@ def compute_time_span_string(
     else:
         how_many_months_string = f"{how_many_months} {LOCALE_CATALOG['months']}"
 
-    # Combine howManyYearsString and howManyMonthsString:
-    if how_many_years_string is None and how_many_months_string is not None:
-        time_span_string = how_many_months_string
-    elif how_many_months_string is None and how_many_years_string is not None:
-        time_span_string = how_many_years_string
-    elif how_many_years_string is not None and how_many_months_string is not None:
-        time_span_string = f"{how_many_years_string} {how_many_months_string}"
-    else:
-        message = "The time span is not valid!"
-        raise ValueError(message)
+    # Combine howManyYearsString and howManyMonthsString. At least one of them is
+    # always available, because the months string is only None when there are years:
+    time_span_string = " ".join(
+        string
+        for string in (how_many_years_string, how_many_months_string)
+        if string is not None
+    )
 
     return time_span_string.strip()
 
 
+def format_start_or_end_date(date: str | int, show_only_years: bool = False) -> str:
+    """Format a start date or an end date of an entry to be used in its date string.
+
+    Example:
+        ```python
+        format_start_or_end_date("2020-01-01")
+        ```
+        returns
+        `"Jan 2020"`
+
+    Args:
+        date: A date in YYYY-MM-DD, YYYY-MM, or YYYY format or "present".
+        show_only_years: If True, only the year of the date will be returned.
+
+    Returns:
+        The formatted date.
+    """
+    if date == "present":
+        return LOCALE_CATALOG["present"]  # type: ignore
+
+    if isinstance(date, int):
+        # Then it means only the year is provided
+        return str(date)
+
+    # Then it means the date is either in YYYY-MM-DD or YYYY-MM format
+    date_object = get_date_object(date)
+    if show_only_years:
+        return str(date_object.year)
+
+    return format_date(date_object)
+
+
 def compute_date_string(
     start_date: Optional[str | int],
     end_date: Optional[str | int],
@@ -274,26 +331,8 @@ def compute_date_string(
                 # Then it is a custom date string (e.g., "My Custom Date")
                 date_string = str(date)
     elif start_date_is_provided and end_date_is_provided:
-        if isinstance(start_date, int):
-            # Then it means only the year is provided
-            start_date = str(start_date)
-        else:
-            # Then it means start_date is either in YYYY-MM-DD or YYYY-MM format
-            date_object = get_date_object(start_date)
-            if show_only_years:
-                start_date = date_object.year
-            else:
-                start_date = format_date(date_object)
-
-        if end_date == "present":
-            end_date = LOCALE_CATALOG["present"]  #  type: ignore
-        elif isinstance(end_date, int):
-            # Then it means only the year is provided
-            end_date = str(end_date)
-        else:
-            # Then it means end_date is either in YYYY-MM-DD or YYYY-MM format
-            date_object = get_date_object(end_date)
-            end_date = date_object.year if show_only_years else format_date(date_object)
+        start_date = format_start_or_end_date(start_date, show_only_years)  # type: ignore
+        end_date = format_start_or_end_date(end_date, show_only_years)  # type: ignore
 
         date_string = f"{start_date} {LOCALE_CATALOG['to']} {end_date}"
 
@@ -333,6 +372,26 @@ def get_date_object(date: str | int) -> Date:
     `datetime.date` object. This function is used throughout the validation process of
     the data models.
 
+    Args:
+        date: The date string to parse.
+
+    Returns:
+        The parsed date.
+    """
+    if date == "present":
+        # Then it is an ongoing event. Today's date changes, so it is not cached:
+        return Date.today()
+
+    return get_date_object_of_a_fixed_date(date)
+
+
+@functools.lru_cache(maxsize=512)
+def get_date_object_of_a_fixed_date(date: str | int) -> Date:
+    """Parse a date string in YYYY-MM-DD, YYYY-MM, or YYYY format (or a year as an
+    integer) and return a `datetime.date` object. The results are cached because the
+    same dates are parsed many times while validating and rendering a CV (e.g., by the
+    date validators, `date_string`, and `time_span_string`).
+
     Args:
         date: The date string to parse.
 
@@ -340,18 +399,37 @@ def get_date_object(date: str | int) -> Date:
         The parsed date.
     """
     if isinstance(date, int):
+        # `Date.fromisoformat` is used instead of `Date(date, 1, 1)` on purpose: it only
+        # accepts four-digit years, just like the YYYY format below:
         date_object = Date.fromisoformat(f"{date}-01-01")
-    elif re.fullmatch(r"\d{4}-\d{2}-\d{2}", date):
-        # Then it is in YYYY-MM-DD format
-        date_object = Date.fromisoformat(date)
-    elif re.fullmatch(r"\d{4}-\d{2}", date):
+    elif (
+        # The string formats have different lengths and the dashes are at fixed
+        # positions, so they can be recognized with simple string checks instead of
+        # regular expressions. `str.isdigit` also accepts non-ASCII digits (e.g.,
+        # full-width digits), so the strings are checked to be ASCII as well, just like
+        # `Date.fromisoformat` requires:
+        date.isascii()
+        and len(date) == 10
+        and date[4] == date[7] == "-"
+        and date[:4].isdigit()
+        and date[5:7].isdigit()
+        and date[8:].isdigit()
+    ):
+        # Then it is in YYYY-MM-DD format. The format is already known, so the digits
+        # can be sliced directly instead of parsing the string again:
+        date_object = Date(int(date[:4]), int(date[5:7]), int(date[8:]))
+    elif (
+        date.isascii()
+        and len(date) == 7
+        and date[4] == "-"
+        and date[:4].isdigit()
+        and date[5:].isdigit()
+    ):
         # Then it is in YYYY-MM format
-        date_object = Date.fromisoformat(f"{date}-01")
-    elif re.fullmatch(r"\d{4}", date):
+        date_object = Date(int(date[:4]), int(date[5:]), 1)
+    elif date.isascii() and len(date) == 4 and date.isdigit():
         # Then it is in YYYY format
-        date_object = Date.fromisoformat(f"{date}-01-01")
-    elif date == "present":
-        date_object = Date.today()
+        date_object = Date(int(date), 1, 1)
     else:
         message = (
             "This is not a valid date! Please use either YYYY-MM-DD, YYYY-MM, or"
@@ -362,26 +440,10 @@ def get_date_object(date: str | int) -> Date:
     return date_object
 
 
-def dictionary_key_to_proper_section_title(key: str) -> str:
-    """Convert a dictionary key to a proper section title.
-
-    Example:
-        ```python
-        dictionary_key_to_proper_section_title("section_title")
-        ```
-        returns
-        `"Section Title"`
-
-    Args:
-        key: The key to convert to a proper section title.
-
-    Returns:
-        The proper section title.
-    """
-    title = key.replace("_", " ")
-    words = title.split(" ")
-
-    words_not_capitalized_in_a_title = [
+# The words that are not capitalized in section titles. It is a set, so checking if a
+# word is in it is fast:
+words_not_capitalized_in_a_title = frozenset(
+    {
         "a",
         "and",
         "as",
@@ -410,7 +472,29 @@ def dictionary_key_to_proper_section_title(key: str) -> str:
         "when",
         "with",
         "yet",
-    ]
+    }
+)
+
+
+@functools.lru_cache(maxsize=256)
+def dictionary_key_to_proper_section_title(key: str) -> str:
+    """Convert a dictionary key to a proper section title.
+
+    Example:
+        ```python
+        dictionary_key_to_proper_section_title("section_title")
+        ```
+        returns
+        `"Section Title"`
+
+    Args:
+        key: The key to convert to a proper section title.
+
+    Returns:
+        The proper section title.
+    """
+    title = key.replace("_", " ")
+    words = title.split(" ")
 
     # loop through the words and if the word doesn't contain any uppercase letters,
     # capitalize the first letter of the word. If the word contains uppercase letters,
@@ -3,6 +3,7 @@ The `rendercv.data.models.curriculum_vitae` module contains the data model of th
 field of the input file.
 """
 
+import collections
 import functools
 import re
 from typing import Annotated, Any, Literal, Optional, get_args
@@ -11,7 +12,11 @@ import pydantic
 import pydantic_extra_types.phone_numbers as pydantic_phone_numbers
 
 from . import computers, entry_types
-from .base import RenderCVBaseModelWithExtraKeys, RenderCVBaseModelWithoutExtraKeys
+from .base import (
+    ModelWithCachedProperties,
+    RenderCVBaseModelWithExtraKeys,
+    RenderCVBaseModelWithoutExtraKeys,
+)
 
 # ======================================================================================
 # Create validator functions: ==========================================================
@@ -33,6 +38,10 @@ class SectionBase(RenderCVBaseModelWithoutExtraKeys):
 # Create a URL validator:
 url_validator = pydantic.TypeAdapter(pydantic.HttpUrl)
 
+# The patterns of the usernames of the social networks that have a specific format:
+mastodon_username_pattern = re.compile(r"@[^@]+@[^@]+")
+stackoverflow_username_pattern = re.compile(r"\d+\/[^\/]+")
+
 
 def validate_url(url: str) -> str:
     """Validate a URL.
@@ -47,13 +56,16 @@ def validate_url(url: str) -> str:
     return url
 
 
+@functools.cache
 def create_a_section_validator(entry_type: type) -> type[SectionBase]:
     """Create a section model based on the entry type. See [Pydantic's documentation
     about dynamic model
     creation](https://pydantic-docs.helpmanual.io/usage/models/#dynamic-model-creation)
     for more information.
 
-    The section model is used to validate a section.
+    The section model is used to validate a section. Building a Pydantic model (and its
+    core schema) is expensive, so only one section model is created for each entry type
+    and it is reused for all the sections.
 
     Args:
         entry_type: The entry type to create the section model. It's not an instance of
@@ -77,27 +89,30 @@ def create_a_section_validator(entry_type: type) -> type[SectionBase]:
     )
 
 
+@functools.cache
 def get_characteristic_entry_attributes(
-    entry_types: list[type],
+    entry_types: tuple[type, ...],
 ) -> dict[type, set[str]]:
-    """Get the characteristic attributes of the entry types.
+    """Get the characteristic attributes of the entry types. The result is cached
+    because the entry types don't change at runtime, and this function is called for
+    each entry and section.
 
     Args:
         entry_types: The entry types to get their characteristic attributes. These are
             not instances of the entry types, but the entry types themselves. `str` type
-            should not be included in this list.
+            should not be included in this tuple.
 
     Returns:
         The characteristic attributes of the entry types.
     """
-    # Look at all the entry types, collect their attributes with
+    # Look at all the entry types, count their attributes with
     # EntryType.model_fields.keys() and find the common ones.
-    all_attributes = []
-    for EntryType in entry_types:
-        all_attributes.extend(EntryType.model_fields.keys())
+    attribute_counts = collections.Counter(
+        attribute for EntryType in entry_types for attribute in EntryType.model_fields
+    )
 
     common_attributes = {
-        attribute for attribute in all_attributes if all_attributes.count(attribute) > 1
+        attribute for attribute, count in attribute_counts.items() if count > 1
     }
 
     # Store each entry type's characteristic attributes in a dictionary:
@@ -111,7 +126,7 @@ def get_characteristic_entry_attributes(
 
 
 def get_entry_type_name_and_section_validator(
-    entry: dict[str, str | list[str]] | str | type, entry_types: list[type]
+    entry: dict[str, str | list[str]] | str | type, entry_types: tuple[type, ...]
 ) -> tuple[str, type[SectionBase]]:
     """Get the entry type name and the section validator based on the entry.
 
@@ -123,7 +138,7 @@ def get_entry_type_name_and_section_validator(
         entry: The entry to determine its type.
         entry_types: The entry types to determine the entry type. These are not
             instances of the entry types, but the entry types themselves. `str` type
-            should not be included in this list.
+            should not be included in this tuple.
 
     Returns:
         The entry type name and the section validator.
@@ -134,6 +149,7 @@ def get_entry_type_name_and_section_validator(
         characteristic_entry_attributes = get_characteristic_entry_attributes(
             entry_types
         )
+        entry_attributes = set(entry.keys())
 
         for (
             EntryType,
@@ -141,7 +157,7 @@ def get_entry_type_name_and_section_validator(
         ) in characteristic_entry_attributes.items():
             # If at least one of the characteristic_entry_attributes is in the entry,
             # then it means the entry is of this type:
-            if characteristic_attributes & set(entry.keys()):
+            if characteristic_attributes & entry_attributes:
                 entry_type_name = EntryType.__name__
                 section_type = create_a_section_validator(EntryType)
                 break
@@ -164,7 +180,7 @@ def get_entry_type_name_and_section_validator(
 
 
 def validate_a_section(
-    sections_input: list[Any], entry_types: list[type]
+    sections_input: list[Any], entry_types: tuple[type, ...]
 ) -> list[entry_types.Entry]:
     """Validate a list of entries (a section) based on the entry types.
 
@@ -178,7 +194,7 @@ def validate_a_section(
         sections_input: The sections input to validate.
         entry_types: The entry types to determine the entry type. These are not
             instances of the entry types, but the entry types themselves. `str` type
-            should not be included in this list.
+            should not be included in this tuple.
 
     Returns:
         The validated sections input.
@@ -248,24 +264,21 @@ def validate_a_social_network_username(username: str, network: str) -> str:
         The validated username.
     """
     if network == "Mastodon":
-        mastodon_username_pattern = r"@[^@]+@[^@]+"
-        if not re.fullmatch(mastodon_username_pattern, username):
+        if not mastodon_username_pattern.fullmatch(username):
             message = 'Mastodon username should be in the format "@username@domain"!'
             raise ValueError(message)
     elif network == "StackOverflow":
-        stackoverflow_username_pattern = r"\d+\/[^\/]+"
-        if not re.fullmatch(stackoverflow_username_pattern, username):
+        if not stackoverflow_username_pattern.fullmatch(username):
             message = (
                 'StackOverflow username should be in the format "user_id/username"!'
             )
             raise ValueError(message)
-    elif network == "YouTube":
-        if username.startswith("@"):
-            message = (
-                'YouTube username should not start with "@"! Remove "@" from the'
-                " beginning of the username."
-            )
-            raise ValueError(message)
+    elif network == "YouTube" and username.startswith("@"):
+        message = (
+            'YouTube username should not start with "@"! Remove "@" from the'
+            " beginning of the username."
+        )
+        raise ValueError(message)
 
     return username
 
@@ -276,9 +289,13 @@ def validate_a_social_network_username(username: str, network: str) -> str:
 
 # Create a custom type named SectionContents, which is a list of entries. The entries
 # can be any of the available entry types. The section is validated with the
-# `validate_a_section` function.
+# `validate_a_section` function. The union is evaluated from left to right so that the
+# already validated entries are accepted by `Any` as they are. Otherwise, Pydantic's
+# smart union mode would copy the list and check the entries against each
+# `ListOfEntries` member again.
 SectionContents = Annotated[
     pydantic.json_schema.SkipJsonSchema[Any] | entry_types.ListOfEntries,
+    pydantic.Field(union_mode="left_to_right"),
     pydantic.BeforeValidator(
         lambda entries: validate_a_section(
             entries, entry_types=entry_types.available_entry_models
@@ -308,12 +325,42 @@ SocialNetworkName = Literal[
 
 available_social_networks = get_args(SocialNetworkName)
 
+# The URL of a social network is the prefix below followed by the username. Mastodon is
+# not included because its URL depends on the domain in the username:
+url_prefixes_of_social_networks = {
+    "LinkedIn": "https://linkedin.com/in/",
+    "GitHub": "https://github.com/",
+    "GitLab": "https://gitlab.com/",
+    "Instagram": "https://instagram.com/",
+    "ORCID": "https://orcid.org/",
+    "StackOverflow": "https://stackoverflow.com/users/",
+    "ResearchGate": "https://researchgate.net/profile/",
+    "YouTube": "https://youtube.com/@",
+    "Google Scholar": "https://scholar.google.com/citations?user=",
+    "Telegram": "https://t.me/",
+}
+
+# The Font Awesome icons of the social networks that are shown in the header of the CV:
+latex_icons_of_social_networks = {
+    "LinkedIn": "\\faLinkedinIn",
+    "GitHub": "\\faGithub",
+    "GitLab": "\\faGitlab",
+    "Instagram": "\\faInstagram",
+    "Mastodon": "\\faMastodon",
+    "ORCID": "\\faOrcid",
+    "StackOverflow": "\\faStackOverflow",
+    "ResearchGate": "\\faResearchgate",
+    "YouTube": "\\faYoutube",
+    "Google Scholar": "\\faGraduationCap",
+    "Telegram": "\\faTelegram",
+}
+
 # ======================================================================================
 # Create the models: ===================================================================
 # ======================================================================================
 
 
-class SocialNetwork(RenderCVBaseModelWithoutExtraKeys):
+class SocialNetwork(ModelWithCachedProperties, RenderCVBaseModelWithoutExtraKeys):
     """This class is the data model of a social network."""
 
     network: SocialNetworkName = pydantic.Field(
@@ -359,24 +406,12 @@ class SocialNetwork(RenderCVBaseModelWithoutExtraKeys):
             _, username, domain = self.username.split("@")
             url = f"https://{domain}/@{username}"
         else:
-            url_dictionary = {
-                "LinkedIn": "https://linkedin.com/in/",
-                "GitHub": "https://github.com/",
-                "GitLab": "https://gitlab.com/",
-                "Instagram": "https://instagram.com/",
-                "ORCID": "https://orcid.org/",
-                "StackOverflow": "https://stackoverflow.com/users/",
-                "ResearchGate": "https://researchgate.net/profile/",
-                "YouTube": "https://youtube.com/@",
-                "Google Scholar": "https://scholar.google.com/citations?user=",
-                "Telegram": "https://t.me/",
-            }
-            url = url_dictionary[self.network] + self.username
+            url = url_prefixes_of_social_networks[self.network] + self.username
 
         return url
 
 
-class CurriculumVitae(RenderCVBaseModelWithExtraKeys):
+class CurriculumVitae(ModelWithCachedProperties, RenderCVBaseModelWithExtraKeys):
     """This class is the data model of the `cv` field."""
 
     name: Optional[str] = pydantic.Field(
@@ -471,34 +506,24 @@ class CurriculumVitae(RenderCVBaseModelWithExtraKeys):
             )
 
         if self.website is not None:
-            website_placeholder = computers.make_a_url_clean(str(self.website))
+            website_url = str(self.website)
+            website_placeholder = computers.make_a_url_clean(website_url)
             connections.append(
                 {
                     "latex_icon": "\\faLink",
-                    "url": str(self.website),
+                    "url": website_url,
                     "clean_url": website_placeholder,
                     "placeholder": website_placeholder,
                 }
             )
 
         if self.social_networks is not None:
-            icon_dictionary = {
-                "LinkedIn": "\\faLinkedinIn",
-                "GitHub": "\\faGithub",
-                "GitLab": "\\faGitlab",
-                "Instagram": "\\faInstagram",
-                "Mastodon": "\\faMastodon",
-                "ORCID": "\\faOrcid",
-                "StackOverflow": "\\faStackOverflow",
-                "ResearchGate": "\\faResearchgate",
-                "YouTube": "\\faYoutube",
-                "Google Scholar": "\\faGraduationCap",
-                "Telegram": "\\faTelegram",
-            }
             for social_network in self.social_networks:
                 clean_url = computers.make_a_url_clean(social_network.url)
                 connection = {
-                    "latex_icon": icon_dictionary[social_network.network],
+                    "latex_icon": latex_icons_of_social_networks[
+                        social_network.network
+                    ],
                     "url": social_network.url,
                     "clean_url": clean_url,
                     "placeholder": social_network.username,
@@ -535,10 +560,12 @@ class CurriculumVitae(RenderCVBaseModelWithExtraKeys):
                 )
 
                 # The first entry can be used because all the entries in the section are
-                # already validated with the `validate_a_section` function:
-                entry_type_name, _ = get_entry_type_name_and_section_validator(
-                    entries[0],  # type: ignore
-                    entry_types=entry_types.available_entry_models,
+                # already validated with the `validate_a_section` function. Only the
+                # entry type name is needed here, so a section validator is not created
+                # again:
+                entry_type = type(entries[0])
+                entry_type_name = (
+                    "TextEntry" if entry_type is str else entry_type.__name__
                 )
 
                 # SectionBase is used so that entries are not validated again:
@@ -3,6 +3,7 @@ The `rendercv.data.models.design` module contains the data model of the `design`
 of the input file.
 """
 
+import functools
 import importlib
 import importlib.util
 import os
@@ -25,10 +26,35 @@ from .base import RenderCVBaseModelWithoutExtraKeys
 # ======================================================================================
 
 
+@functools.cache
+def get_required_files_of_a_custom_theme(
+    available_entry_type_names: tuple[str, ...],
+) -> tuple[str, ...]:
+    """Get the names of the template files that a custom theme folder should contain.
+
+    Args:
+        available_entry_type_names: The available entry type names. Each of them needs
+            its own template.
+
+    Returns:
+        The names of the required template files.
+    """
+    required_entry_files = tuple(
+        entry_type_name + ".j2.tex" for entry_type_name in available_entry_type_names
+    )
+    return (
+        "SectionBeginning.j2.tex",  # section beginning template
+        "SectionEnding.j2.tex",  # section ending template
+        "Preamble.j2.tex",  # preamble template
+        "Header.j2.tex",  # header template
+        *required_entry_files,
+    )
+
+
 def validate_design_options(
     design: Any,
     available_theme_options: dict[str, type],
-    available_entry_type_names: list[str],
+    available_entry_type_names: tuple[str, ...],
 ) -> Any:
     """Chech if the design options are for a built-in theme or a custom theme. If it is
     a built-in theme, validate it with the corresponding data model. If it is a custom
@@ -40,17 +66,12 @@ def validate_design_options(
         available_theme_options: The available theme options. The keys are the theme
             names and the values are the corresponding data models.
         available_entry_type_names: The available entry type names. These are used to
-            validate if all the templates are provided in the custom theme folder.
+            validate if all the templates are provided in the custom theme folder. It
+            is a tuple, so the required file names are cached for it.
 
     Returns:
         The validated design as a Pydantic data model.
     """
-    from .rendercv_data_model import INPUT_FILE_DIRECTORY
-
-    original_working_directory = pathlib.Path.cwd()
-
-    # Change the working directory to the input file directory:
-
     if isinstance(design, tuple(available_theme_options.values())):
         # Then it means it is an already validated built-in theme. Return it as it is:
         return design
@@ -59,7 +80,13 @@ def validate_design_options(
         # return it:
         ThemeDataModel = available_theme_options[design["theme"]]
         return ThemeDataModel(**design)
-    # It is a custom theme. Validate it:
+    # It is a custom theme. Validate it. The input file directory and the working
+    # directory are only needed for custom themes, so they are not looked up for the
+    # built-in themes above:
+    from .rendercv_data_model import INPUT_FILE_DIRECTORY
+
+    original_working_directory = pathlib.Path.cwd()
+
     theme_name: str = str(design["theme"])
 
     # Custom theme should only contain letters and digits:
@@ -88,18 +115,7 @@ def validate_design_options(
         )
 
     # check if all the necessary files are provided in the custom theme folder:
-    required_entry_files = [
-        entry_type_name + ".j2.tex" for entry_type_name in available_entry_type_names
-    ]
-    required_files = [
-        "SectionBeginning.j2.tex",  # section beginning template
-        "SectionEnding.j2.tex",  # section ending template
-        "Preamble.j2.tex",  # preamble template
-        "Header.j2.tex",  # header template
-        *required_entry_files,
-    ]
-
-    for file in required_files:
+    for file in get_required_files_of_a_custom_theme(available_entry_type_names):
         file_path = custom_theme_folder / file
         if not file_path.exists():
             message = (
@@ -188,7 +204,7 @@ RenderCVDesign = Annotated[
         lambda design: validate_design_options(
             design,
             available_theme_options=available_theme_options,
-            available_entry_type_names=entry_types.available_entry_type_names,  # type: ignore
+            available_entry_type_names=entry_types.available_entry_type_names,
         )
     ),
 ]
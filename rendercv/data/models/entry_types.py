@@ -11,12 +11,17 @@ from typing import Annotated, Literal, Optional
 import pydantic
 
 from . import computers
-from .base import RenderCVBaseModelWithExtraKeys
+from .base import ModelWithCachedProperties, RenderCVBaseModelWithExtraKeys
 
 # ======================================================================================
 # Create validator functions: ==========================================================
 # ======================================================================================
 
+# Exactly YYYY-MM or YYYY-MM-DD:
+date_pattern = re.compile(r"\d{4}-\d{2}(-\d{2})?")
+# Exactly YYYY:
+year_pattern = re.compile(r"\d{4}")
+
 
 def validate_date_field(date: Optional[int | str]) -> Optional[int | str]:
     """Check if the `date` field is provided correctly.
@@ -31,11 +36,12 @@ def validate_date_field(date: Optional[int | str]) -> Optional[int | str]:
 
     if date_is_provided:
         if isinstance(date, str):
-            if re.fullmatch(r"\d{4}-\d{2}(-\d{2})?", date):
-                # Then it is in YYYY-MM-DD or YYYY-MMY format
-                # Check if it is a valid date:
-                computers.get_date_object(date)
-            elif re.fullmatch(r"\d{4}", date):
+            if date_pattern.fullmatch(date):
+                # Then it is in YYYY-MM-DD or YYYY-MM format. Check if it is a valid
+                # date with the cached parser, which is shared with the other date
+                # validators and the date computers:
+                computers.get_date_object_of_a_fixed_date(date)
+            elif year_pattern.fullmatch(date):
                 # Then it is in YYYY format, so, convert it to an integer:
 
                 # This is not required for start_date and end_date because they
@@ -109,13 +115,16 @@ def validate_and_adjust_dates_for_an_entry(
         start_date = None
         end_date = None
     elif start_date_is_provided:
-        start_date_object = computers.get_date_object(start_date)
         if not end_date_is_provided:
             # If only start_date is provided, assume it is an ongoing event, i.e.,
             # the end_date is present:
             end_date = "present"
 
         if end_date != "present":
+            # Both dates are already validated by their field validators. They are
+            # parsed again only to compare them, which is not needed for ongoing
+            # events:
+            start_date_object = computers.get_date_object(start_date)
             end_date_object = computers.get_date_object(end_date)
 
             if start_date_object > end_date_object:
@@ -139,11 +148,12 @@ def validate_and_adjust_dates_for_an_entry(
 # https://docs.pydantic.dev/2.7/concepts/validators/#annotated-validators
 # for more information about custom types.
 
-# ExactDate that accepts only strings in YYYY-MM-DD or YYYY-MM format:
+# ExactDate that accepts only strings in YYYY-MM-DD or YYYY-MM format. The pattern is
+# anchored so that it fails fast and doesn't match dates inside other strings:
 ExactDate = Annotated[
     str,
     pydantic.Field(
-        pattern=r"\d{4}-\d{2}(-\d{2})?",
+        pattern=r"^\d{4}-\d{2}(-\d{2})?$",
     ),
 ]
 
@@ -195,7 +205,7 @@ class BulletEntry(RenderCVBaseModelWithExtraKeys):
     )
 
 
-class EntryWithDate(RenderCVBaseModelWithExtraKeys):
+class EntryWithDate(ModelWithCachedProperties, RenderCVBaseModelWithExtraKeys):
     """This class is the parent class of some of the entry types that have date
     fields.
     """
@@ -220,7 +230,7 @@ class EntryWithDate(RenderCVBaseModelWithExtraKeys):
         )
 
 
-class PublicationEntryBase(RenderCVBaseModelWithExtraKeys):
+class PublicationEntryBase(ModelWithCachedProperties, RenderCVBaseModelWithExtraKeys):
     """This class is the parent class of the `PublicationEntry` class."""
 
     title: str = pydantic.Field(
@@ -254,8 +264,11 @@ class PublicationEntryBase(RenderCVBaseModelWithExtraKeys):
     def ignore_url_if_doi_is_given(self) -> "PublicationEntryBase":
         """Check if DOI is provided and ignore the URL if it is provided."""
         doi_is_provided = self.doi is not None
+        url_is_provided = self.url is not None
 
-        if doi_is_provided:
+        # Assigning a field drops the cached properties, so it is done only if there
+        # is a URL to ignore:
+        if doi_is_provided and url_is_provided:
             self.url = None
 
         return self
@@ -335,11 +348,24 @@ class EntryBase(EntryWithDate):
         """Call the `validate_adjust_dates_of_an_entry` function to validate the
         dates.
         """
-        self.start_date, self.end_date, self.date = (
-            validate_and_adjust_dates_for_an_entry(
-                start_date=self.start_date, end_date=self.end_date, date=self.date
-            )
+        if self.date is None and self.start_date is None and self.end_date is None:
+            # Then there is nothing to validate or adjust (e.g., an entry without any
+            # dates), so skip the assignments below:
+            return self
+
+        start_date, end_date, date = validate_and_adjust_dates_for_an_entry(
+            start_date=self.start_date, end_date=self.end_date, date=self.date
         )
+
+        # Assigning a field drops the cached properties, so only the adjusted fields
+        # are assigned:
+        if start_date != self.start_date:
+            self.start_date = start_date
+        if end_date != self.end_date:
+            self.end_date = end_date
+        if date != self.date:
+            self.date = date
+
         return self
 
     @functools.cached_property
@@ -4,13 +4,44 @@ file (YAML or JSON) and return them as an instance of `RenderCVDataModel`, which
 Pydantic data model of RenderCV's data format.
 """
 
+import json
 import pathlib
-from typing import Optional
+from typing import Any, Optional
 
 import ruamel.yaml
 
 from . import models
 
+# The YAML parser is created once and reused for all the input files because creating
+# it is not free. The safe loader is used because it uses the C extension of ruamel.yaml
+# if it is available, and the comments and the formatting that the round-trip loader
+# preserves are not needed while reading the input files:
+yaml_parser = ruamel.yaml.YAML(typ="safe")
+
+# The extensions of the input files that RenderCV accepts:
+accepted_input_file_extensions = (".yaml", ".yml", ".json", ".json5")
+
+
+def create_a_dictionary_from_json_key_value_pairs(
+    key_value_pairs: list[tuple[str, Any]],
+) -> dict[str, Any]:
+    """Create a dictionary from the key-value pairs of a JSON object. It is used as the
+    `object_pairs_hook` of `json.loads`, which would otherwise keep only the last value
+    of a repeated key silently.
+
+    Args:
+        key_value_pairs: The key-value pairs of the JSON object.
+
+    Returns:
+        The JSON object as a dictionary.
+    """
+    dictionary = dict(key_value_pairs)
+    if len(dictionary) != len(key_value_pairs):
+        message = "The JSON object has duplicate keys!"
+        raise ValueError(message)
+
+    return dictionary
+
 
 def read_a_yaml_file(file_path_or_contents: pathlib.Path | str) -> dict:
     """Read a YAML file and return its content as a dictionary. The YAML file can be
@@ -24,16 +55,18 @@ def read_a_yaml_file(file_path_or_contents: pathlib.Path | str) -> dict:
         The content of the YAML file as a dictionary.
     """
     if isinstance(file_path_or_contents, pathlib.Path):
-        # Check if the file exists:
-        if not file_path_or_contents.exists():
+        # The file is read directly instead of checking if it exists first, so the file
+        # system is accessed only once:
+        try:
+            file_content = file_path_or_contents.read_text(encoding="utf-8")
+        except FileNotFoundError as e:
             message = f"The input file {file_path_or_contents} doesn't exist!"
-            raise FileNotFoundError(message)
+            raise FileNotFoundError(message) from e
 
         # Check the file extension:
-        accepted_extensions = [".yaml", ".yml", ".json", ".json5"]
-        if file_path_or_contents.suffix not in accepted_extensions:
+        if file_path_or_contents.suffix not in accepted_input_file_extensions:
             user_friendly_accepted_extensions = [
-                f"[green]{ext}[/green]" for ext in accepted_extensions
+                f"[green]{ext}[/green]" for ext in accepted_input_file_extensions
             ]
             user_friendly_accepted_extensions = ", ".join(
                 user_friendly_accepted_extensions
@@ -45,11 +78,26 @@ def read_a_yaml_file(file_path_or_contents: pathlib.Path | str) -> dict:
             )
             raise ValueError(message)
 
-        file_content = file_path_or_contents.read_text(encoding="utf-8")
+        file_is_json = file_path_or_contents.suffix == ".json"
     else:
         file_content = file_path_or_contents
-
-    yaml_as_a_dictionary: dict = ruamel.yaml.YAML().load(file_content)
+        file_is_json = False
+
+    if file_is_json:
+        # JSON is a subset of YAML, but the built-in JSON parser is much faster than
+        # the YAML parser:
+        try:
+            yaml_as_a_dictionary: dict = json.loads(
+                file_content,
+                object_pairs_hook=create_a_dictionary_from_json_key_value_pairs,
+            )
+        except ValueError:
+            # Then it means it is not a strict JSON file (e.g., it has comments) or it
+            # has duplicate keys, so, parse it as YAML. The YAML parser reports the
+            # duplicate keys with their locations:
+            yaml_as_a_dictionary = yaml_parser.load(file_content)
+    else:
+        yaml_as_a_dictionary = yaml_parser.load(file_content)
 
     if yaml_as_a_dictionary is None:
         message = "The input file is empty!"
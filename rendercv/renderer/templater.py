@@ -5,6 +5,7 @@ object.
 """
 
 import copy
+import functools
 import pathlib
 import re
 from datetime import date as Date
@@ -14,6 +15,46 @@ import jinja2
 
 from .. import data
 
+# The patterns of the parts that `escape_latex_characters` shouldn't escape. They are
+# compiled once because the function is called for every string in the input file:
+link_pattern = re.compile(r"\[(.*?)\]\((.*?)\)")
+equation_pattern = re.compile(r"(\$\$.*?\$\$)")
+latex_command_pattern = re.compile(r"\\[a-zA-Z]+\{.*?\}")
+
+# The patterns of the value and the unit of a length (e.g., "10.4 cm"), which are used
+# by the `divide_length_by` filter in the templates:
+length_value_pattern = re.compile(r"\d+\.?\d*")
+length_unit_pattern = re.compile(r"[^\d\.\s]+")
+
+# The patterns of the Markdown syntax that `markdown_to_latex` converts to LaTeX:
+markdown_link_pattern = re.compile(r"\[([^\]\[]*)\]\((.*?)\)")
+markdown_bold_pattern = re.compile(r"\*\*(.+?)\*\*")
+markdown_italic_pattern = re.compile(r"\*(.+?)\*")
+
+# The patterns of the nested LaTeX style commands (e.g., a \textbf inside a \textbf)
+# that `revert_nested_latex_style_commands` replaces with \textnormal:
+nested_latex_style_command_patterns = {
+    command: re.compile(rf"\\{command}{{[^}}]*?(\\{command}{{.*?}})")
+    for command in ("textbf", "textit", "underline")
+}
+
+# Dictionary of escape characters:
+escape_characters = {
+    "{": "\\{",
+    "}": "\\}",
+    # "\\": "\\textbackslash{}",
+    "#": "\\#",
+    "%": "\\%",
+    "&": "\\&",
+    "~": "\\textasciitilde{}",
+    "$": "\\$",
+    "_": "\\_",
+    "^": "\\textasciicircum{}",
+}
+# The translation table is built once, and each string is escaped with a single
+# `str.translate` pass:
+latex_escape_translation_table = str.maketrans(escape_characters)
+
 
 class TemplatedFile:
     """This class is a base class for `LaTeXFile` and `MarkdownFile` classes. It
@@ -34,6 +75,8 @@ class TemplatedFile:
         self.cv = data_model.cv
         self.design = data_model.design
         self.environment = environment
+        # Today's date is the same for all the templates, so compute it only once:
+        self.today = data.format_date(Date.today(), date_style="FULL_MONTH_NAME YEAR")
 
     def template(
         self,
@@ -75,7 +118,7 @@ class TemplatedFile:
             cv=self.cv,
             design=self.design,
             entry=entry,
-            today=data.format_date(Date.today(), date_style="FULL_MONTH_NAME YEAR"),
+            today=self.today,
             **kwargs,
         )
 
@@ -283,22 +326,14 @@ def revert_nested_latex_style_commands(latex_string: str) -> str:
     """
     # If there is nested \textbf, \textit, or \underline commands, replace the inner
     # ones with \textnormal:
-    nested_commands_to_look_for = [
-        "textbf",
-        "textit",
-        "underline",
-    ]
-
-    for command in nested_commands_to_look_for:
+    for command, nested_command_pattern in nested_latex_style_command_patterns.items():
         nested_commands = True
         while nested_commands:
             # replace all the inner commands with \textnormal until there are no
             # nested commands left:
 
             # find the first nested command:
-            nested_commands = re.findall(
-                rf"\\{command}{{[^}}]*?(\\{command}{{.*?}})", latex_string
-            )
+            nested_commands = nested_command_pattern.findall(latex_string)
 
             # replace the nested command with \textnormal:
             for nested_command in nested_commands:
@@ -308,6 +343,7 @@ def revert_nested_latex_style_commands(latex_string: str) -> str:
     return latex_string
 
 
+@functools.lru_cache(maxsize=1024)
 def escape_latex_characters(latex_string: str) -> str:
     """Escape $\\LaTeX$ characters in a string by adding a backslash before them.
 
@@ -325,30 +361,15 @@ def escape_latex_characters(latex_string: str) -> str:
         The escaped string.
     """
 
-    # Dictionary of escape characters:
-    escape_characters = {
-        "{": "\\{",
-        "}": "\\}",
-        # "\\": "\\textbackslash{}",
-        "#": "\\#",
-        "%": "\\%",
-        "&": "\\&",
-        "~": "\\textasciitilde{}",
-        "$": "\\$",
-        "_": "\\_",
-        "^": "\\textasciicircum{}",
-    }
-    translation_map = str.maketrans(escape_characters)
-
     # Don't escape urls as hyperref package will do it automatically:
     # Find all the links in the sentence:
-    links = re.findall(r"\[(.*?)\]\((.*?)\)", latex_string)
+    links = link_pattern.findall(latex_string)
 
     # Replace the links with a dummy string and save links with escaped characters:
     new_links = []
     for i, link in enumerate(links):
         placeholder = link[0]
-        escaped_placeholder = placeholder.translate(translation_map)
+        escaped_placeholder = placeholder.translate(latex_escape_translation_table)
         url = link[1]
 
         original_link = f"[{placeholder}]({url})"
@@ -359,7 +380,7 @@ def escape_latex_characters(latex_string: str) -> str:
 
     # If there are equations in the sentence, don't escape the special characters:
     # Find all the equations in the sentence:
-    equations = re.findall(r"(\$\$.*?\$\$)", latex_string)
+    equations = equation_pattern.findall(latex_string)
     new_equations = []
     for i, equation in enumerate(equations):
         latex_string = latex_string.replace(equation, f"!!-equation{i}-!!")
@@ -370,29 +391,33 @@ def escape_latex_characters(latex_string: str) -> str:
 
     # Don't touch latex commands:
     # Find all the latex commands in the sentence:
-    latex_commands = re.findall(r"\\[a-zA-Z]+\{.*?\}", latex_string)
+    latex_commands = latex_command_pattern.findall(latex_string)
     for i, latex_command in enumerate(latex_commands):
         latex_string = latex_string.replace(latex_command, f"!!-latex{i}-!!")
 
-    # Loop through the letters of the sentence and if you find an escape character,
-    # replace it with its LaTeX equivalent:
-    latex_string = latex_string.translate(translation_map)
+    # Replace the escape characters with their LaTeX equivalents:
+    latex_string = latex_string.translate(latex_escape_translation_table)
 
-    # Replace !!-link{i}-!!" with the original urls:
-    for i, new_link in enumerate(new_links):
-        latex_string = latex_string.replace(f"!!-link{i}-!!", new_link)
+    # The dummy strings are replaced back in the reverse order because a latex command
+    # can contain the dummy strings of the equations and the links (e.g., a link inside
+    # a \textbf), and an equation can contain the dummy strings of the links.
+
+    # Replace !!-latex{i}-!!" with the original latex commands:
+    for i, latex_command in enumerate(latex_commands):
+        latex_string = latex_string.replace(f"!!-latex{i}-!!", latex_command)
 
     # Replace !!-equation{i}-!!" with the original equations:
     for i, new_equation in enumerate(new_equations):
         latex_string = latex_string.replace(f"!!-equation{i}-!!", new_equation)
 
-    # Replace !!-latex{i}-!!" with the original latex commands:
-    for i, latex_command in enumerate(latex_commands):
-        latex_string = latex_string.replace(f"!!-latex{i}-!!", latex_command)
+    # Replace !!-link{i}-!!" with the original urls:
+    for i, new_link in enumerate(new_links):
+        latex_string = latex_string.replace(f"!!-link{i}-!!", new_link)
 
     return latex_string
 
 
+@functools.lru_cache(maxsize=1024)
 def markdown_to_latex(markdown_string: str) -> str:
     """Convert a Markdown string to $\\LaTeX$.
 
@@ -416,35 +441,17 @@ def markdown_to_latex(markdown_string: str) -> str:
     Returns:
         The $\\LaTeX$ string.
     """
-    # convert links
-    links = re.findall(r"\[([^\]\[]*)\]\((.*?)\)", markdown_string)
-    if links is not None:
-        for link in links:
-            link_text = link[0]
-            link_url = link[1]
-
-            old_link_string = f"[{link_text}]({link_url})"
-            new_link_string = "\\href{" + link_url + "}{" + link_text + "}"
-
-            markdown_string = markdown_string.replace(old_link_string, new_link_string)
-
-    # convert bold
-    bolds = re.findall(r"\*\*(.+?)\*\*", markdown_string)
-    if bolds is not None:
-        for bold_text in bolds:
-            old_bold_text = f"**{bold_text}**"
-            new_bold_text = "\\textbf{" + bold_text + "}"
-
-            markdown_string = markdown_string.replace(old_bold_text, new_bold_text)
-
-    # convert italic
-    italics = re.findall(r"\*(.+?)\*", markdown_string)
-    if italics is not None:
-        for italic_text in italics:
-            old_italic_text = f"*{italic_text}*"
-            new_italic_text = "\\textit{" + italic_text + "}"
-
-            markdown_string = markdown_string.replace(old_italic_text, new_italic_text)
+    # convert links in a single pass (group 1 is the link text and group 2 is the url):
+    markdown_string = markdown_link_pattern.sub(
+        lambda link: f"\\href{{{link[2]}}}{{{link[1]}}}",
+        markdown_string,
+    )
+
+    # convert bold in a single pass:
+    markdown_string = markdown_bold_pattern.sub(
+        lambda bold: f"\\textbf{{{bold[1]}}}",
+        markdown_string,
+    )
 
     # convert code
     # not supported by rendercv currently
@@ -456,7 +463,11 @@ def markdown_to_latex(markdown_string: str) -> str:
 
     #         markdown_string = markdown_string.replace(old_code_text, new_code_text)
 
-    return markdown_string
+    # convert italic in a single pass:
+    return markdown_italic_pattern.sub(
+        lambda italic: f"\\textit{{{italic[1]}}}",
+        markdown_string,
+    )
 
 
 def transform_markdown_sections_to_latex_sections(
@@ -693,6 +704,7 @@ def abbreviate_name(name: Optional[str]) -> str:
     return " ".join(first_names_initials) + " " + last_name
 
 
+@functools.lru_cache(maxsize=64)
 def divide_length_by(length: str, divider: float) -> str:
     r"""Divide a length by a number. Length is a string with the following regex
     pattern: `\d+\.?\d* *(cm|in|pt|mm|ex|em)`
@@ -716,7 +728,7 @@ def divide_length_by(length: str, divider: float) -> str:
         The divided length.
     """
     # Get the value as a float and the unit as a string:
-    value = re.search(r"\d+\.?\d*", length)
+    value = length_value_pattern.search(length)
 
     if value is None:
         message = f"Invalid length {length}!"
@@ -728,7 +740,7 @@ def divide_length_by(length: str, divider: float) -> str:
         message = f"The divider must be greater than 0, but got {divider}!"
         raise ValueError(message)
 
-    unit = re.findall(r"[^\d\.\s]+", length)[0]
+    unit = length_unit_pattern.findall(length)[0]
 
     return str(float(value) / divider) + " " + unit
 
@@ -27,7 +27,7 @@ class MarginsForClassic(Margins):
     """This class is a data model for the margins."""
 
     entry_area: EntryAreaMarginsForClassic = pydantic.Field(
-        default=EntryAreaMarginsForClassic(),
+        default=EntryAreaMarginsForClassic.model_construct(),
         title="Entry Area Margins",
         description="Entry area margins.",
     )
@@ -45,6 +45,7 @@ class ClassicThemeOptions(ThemeOptions):
         "Charter",
     ] = pydantic.Field(
         default="Source Sans 3",
+        validate_default=False,
         title="Font",
         description="The font family of the CV. The default value is Source Sans 3.",
     )
@@ -59,7 +60,8 @@ class ClassicThemeOptions(ThemeOptions):
         ),
     )
     margins: MarginsForClassic = pydantic.Field(
-        default=MarginsForClassic(),
+        default=MarginsForClassic.model_construct(),
+        validate_default=False,
         title="Margins",
         description="Page, section title, entry field, and highlights field margins.",
     )
@@ -150,28 +150,30 @@ class HeaderMargins(RenderCVBaseModelWithoutExtraKeys):
 class Margins(RenderCVBaseModelWithoutExtraKeys):
     """This class is a data model for the margins."""
 
+    # The default margins below are literals that are known to be valid, so they are
+    # created with `model_construct` to skip their validation:
     page: PageMargins = pydantic.Field(
-        default=PageMargins(),
+        default=PageMargins.model_construct(),
         title="Page Margins",
         description="Page margins.",
     )
     section_title: SectionTitleMargins = pydantic.Field(
-        default=SectionTitleMargins(),
+        default=SectionTitleMargins.model_construct(),
         title="Section Title Margins",
         description="Section title margins.",
     )
     entry_area: EntryAreaMargins = pydantic.Field(
-        default=EntryAreaMargins(),
+        default=EntryAreaMargins.model_construct(),
         title="Entry Area Margins",
         description="Entry area margins.",
     )
     highlights_area: HighlightsAreaMargins = pydantic.Field(
-        default=HighlightsAreaMargins(),
+        default=HighlightsAreaMargins.model_construct(),
         title="Highlights Area Margins",
         description="Highlights area margins.",
     )
     header: HeaderMargins = pydantic.Field(
-        default=HeaderMargins(),
+        default=HeaderMargins.model_construct(),
         title="Header Margins",
         description="Header margins.",
     )
@@ -195,6 +197,7 @@ class ThemeOptions(RenderCVBaseModelWithoutExtraKeys):
         "Charter",
     ] = pydantic.Field(
         default="Latin Modern Serif",
+        validate_default=False,
         title="Font",
         description=(
             "The font family of the CV. The default value is Latin Modern Serif."
@@ -202,11 +205,13 @@ class ThemeOptions(RenderCVBaseModelWithoutExtraKeys):
     )
     font_size: Literal["10pt", "11pt", "12pt"] = pydantic.Field(
         default="10pt",
+        validate_default=False,
         title="Font Size",
         description="The font size of the CV. The default value is 10pt.",
     )
     page_size: Literal["a4paper", "letterpaper"] = pydantic.Field(
         default="letterpaper",
+        validate_default=False,
         title="Page Size",
         description=(
             "The page size of the CV. It can be a4paper or letterpaper. The default"
@@ -301,7 +306,8 @@ class ThemeOptions(RenderCVBaseModelWithoutExtraKeys):
         ),
     )
     margins: Margins = pydantic.Field(
-        default=Margins(),
+        default=Margins.model_construct(),
+        validate_default=False,
         title="Margins",
         description="Page, section title, entry field, and highlights field margins.",
     )
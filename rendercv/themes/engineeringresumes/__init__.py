@@ -78,17 +78,17 @@ class MarginsForEngineeringresumes(Margins):
     """This class is a data model for the margins."""
 
     entry_area: EntryAreaMarginsForEngineeringresumes = pydantic.Field(
-        default=EntryAreaMarginsForEngineeringresumes(),
+        default=EntryAreaMarginsForEngineeringresumes.model_construct(),
         title="Entry Area Margins",
         description="Entry area margins.",
     )
     highlights_area: HighlightsAreaMarginsForEngineeringresumes = pydantic.Field(
-        default=HighlightsAreaMarginsForEngineeringresumes(),
+        default=HighlightsAreaMarginsForEngineeringresumes.model_construct(),
         title="Highlights Area Margins",
         description="Highlights area margins.",
     )
     header: HeaderMarginsForEngineeringresumes = pydantic.Field(
-        default=HeaderMarginsForEngineeringresumes(),
+        default=HeaderMarginsForEngineeringresumes.model_construct(),
         title="Header Margins",
         description="Header margins.",
     )
@@ -108,6 +108,7 @@ class EngineeringresumesThemeOptions(ThemeOptions):
         "Charter",
     ] = pydantic.Field(
         default="Charter",
+        validate_default=False,
         title="Font",
         description="The font family of the CV. The default value is Charter.",
     )
@@ -179,7 +180,8 @@ class EngineeringresumesThemeOptions(ThemeOptions):
         ),
     )
     margins: MarginsForEngineeringresumes = pydantic.Field(
-        default=MarginsForEngineeringresumes(),
+        default=MarginsForEngineeringresumes.model_construct(),
+        validate_default=False,
         title="Margins",
         description="Page, section title, entry field, and highlights field margins.",
     )
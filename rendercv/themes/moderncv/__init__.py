@@ -14,12 +14,14 @@ class ModerncvThemeOptions(RenderCVBaseModelWithoutExtraKeys):
     theme: Literal["moderncv"]
     font_size: Literal["10pt", "11pt", "12pt"] = pydantic.Field(
         default="10pt",
+        validate_default=False,
         title="Font Size",
         description='The font size of the CV. The default value is "10pt".',
         examples=["10pt", "11pt", "12pt"],
     )
     page_size: Literal["a4paper", "letterpaper"] = pydantic.Field(
         default="letterpaper",
+        validate_default=False,
         title="Page Size",
         description='The page size of the CV. The default value is "letterpaper".',
         examples=["a4paper", "letterpaper"],
@@ -17,6 +17,7 @@ class Sb2novThemeOptions(ThemeOptions):
         "Charter",
     ] = pydantic.Field(
         default="Latin Modern Serif",
+        validate_default=False,
         title="Font",
         description=(
             "The font family of the CV. The default value is Latin Modern Serif."
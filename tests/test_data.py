@@ -17,6 +17,7 @@ from rendercv.data.models import (
     entry_types,
     locale_catalog,
 )
+from rendercv.themes import ClassicThemeOptions
 
 
 @pytest.mark.parametrize(
@@ -27,6 +28,11 @@ from rendercv.data.models import (
         ("2020", Date(2020, 1, 1), None),
         (2020, Date(2020, 1, 1), None),
         ("present", Date(2024, 1, 1), None),
+        (999, None, ValueError),
+        ("0000", None, ValueError),
+        ("२०२०-०१", None, ValueError),  # Devanagari digits
+        ("२०२०-०१-०१", None, ValueError),
+        ("२०२०", None, ValueError),
         ("invalid", None, ValueError),
         ("20222", None, ValueError),
         ("202222-20200", None, ValueError),
@@ -43,6 +49,14 @@ def test_get_date_object(date, expected_date_object, expected_error):
         assert computers.get_date_object(date) == expected_date_object
 
 
+def test_get_date_object_present_is_not_cached():
+    with time_machine.travel("2024-01-01"):
+        assert computers.get_date_object("present") == Date(2024, 1, 1)
+
+    with time_machine.travel("2025-06-15"):
+        assert computers.get_date_object("present") == Date(2025, 6, 15)
+
+
 @pytest.mark.parametrize(
     ("date", "expected_date_string"),
     [
@@ -93,6 +107,33 @@ def test_read_input_file_directly_with_contents():
     assert isinstance(data_model, data.RenderCVDataModel)
 
 
+@pytest.mark.parametrize(
+    "json_string",
+    [
+        '{"cv": {"name": "John Doe"}, "design": {"theme": "classic"}}',
+        '{"cv": {"name": "John Doe"}, # a comment\n "design": {"theme": "classic"}}',
+    ],
+)
+def test_read_input_file_json(tmp_path, json_string):
+    json_file_path = tmp_path / "input.json"
+    json_file_path.write_text(json_string, encoding="utf-8")
+
+    data_model = data.read_input_file(json_file_path)
+
+    assert data_model.cv.name == "John Doe"
+    assert data_model.design.theme == "classic"
+
+
+def test_read_input_file_json_with_duplicate_keys(tmp_path):
+    json_file_path = tmp_path / "input.json"
+    json_file_path.write_text(
+        '{"cv": {"name": "John Doe", "name": "Jane Doe"}}', encoding="utf-8"
+    )
+
+    with pytest.raises(ruamel.yaml.YAMLError):
+        data.read_input_file(json_file_path)
+
+
 def test_read_input_file_invalid_file(tmp_path):
     invalid_file_path = tmp_path / "invalid.extension"
     invalid_file_path.write_text("dummy content", encoding="utf-8")
@@ -100,8 +141,9 @@ def test_read_input_file_invalid_file(tmp_path):
         data.read_input_file(invalid_file_path)
 
 
-def test_read_input_file_that_doesnt_exist(tmp_path):
-    non_existent_file_path = tmp_path / "non_existent_file.yaml"
+@pytest.mark.parametrize("file_name", ["non_existent_file.yaml", "cv.txt"])
+def test_read_input_file_that_doesnt_exist(tmp_path, file_name):
+    non_existent_file_path = tmp_path / file_name
     with pytest.raises(FileNotFoundError):
         data.read_input_file(non_existent_file_path)
 
@@ -325,16 +367,50 @@ def test_dates(
     assert entry_base.time_span_string == expected_time_span
 
 
+def test_cached_properties_are_updated_after_assignment():
+    entry_base = entry_types.EntryBase(start_date="2020-01", end_date="2021-01")
+    assert entry_base.date_string == "Jan 2020 – Jan 2021"  # NOQA: RUF001
+
+    entry_base.end_date = "2022-01"
+    assert entry_base.date_string == "Jan 2020 – Jan 2022"  # NOQA: RUF001
+
+    cv = data.CurriculumVitae(sections={"test": ["test"]})
+    assert [section.title for section in cv.sections] == ["Test"]
+
+    cv.sections_input = {"another_test": ["test"]}
+    assert [section.title for section in cv.sections] == ["Another Test"]
+
+
 def test_dates_style():
     assert data.format_date(Date(2020, 1, 1), "TEST") == "TEST"
 
 
+def test_format_date_follows_locale_catalog_updates():
+    assert data.format_date(Date(2020, 1, 1)) == "Jan 2020"
+
+    data.LocaleCatalog(abbreviations_for_months=[str(i) for i in range(1, 13)])
+    assert data.format_date(Date(2020, 1, 1)) == "1 2020"
+
+    data.LocaleCatalog()
+    assert data.format_date(Date(2020, 1, 1)) == "Jan 2020"
+
+
+def test_section_validators_are_reused():
+    assert curriculum_vitae.create_a_section_validator(
+        entry_types.NormalEntry
+    ) is curriculum_vitae.create_a_section_validator(entry_types.NormalEntry)
+
+
 @pytest.mark.parametrize(
     ("date", "expected_date_string"),
     [
         ("2020-01-01", "Jan 2020"),
         ("2020-01", "Jan 2020"),
         ("2020", "2020"),
+        ("Fall 2023", "Fall 2023"),
+        ("2020-2021", "2020-2021"),
+        ("2019--2020", "2019--2020"),
+        ("2020-12345", "2020-12345"),
     ],
 )
 def test_publication_dates(publication_entry, date, expected_date_string):
@@ -343,7 +419,28 @@ def test_publication_dates(publication_entry, date, expected_date_string):
     assert publication_entry.date_string == expected_date_string
 
 
-@pytest.mark.parametrize("date", ["2025-23-23"])
+@pytest.mark.parametrize(
+    ("date", "expected_date"),
+    [
+        ("0000", 0),
+        ("\uff12\uff10\uff12\uff10", 2020),  # full-width digits
+        ("\u0968\u0966\u0968\u0966", 2020),  # Devanagari digits
+    ],
+)
+def test_publication_dates_with_unusual_years(publication_entry, date, expected_date):
+    publication_entry["date"] = date
+    publication_entry = data.PublicationEntry(**publication_entry)
+    assert publication_entry.date == expected_date
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        "2025-23-23",
+        "\uff12\uff10\uff12\uff10-\uff10\uff11",  # full-width digits
+        "\u0968\u0966\u0968\u0966-\u0966\u0967-\u0966\u0967",  # Devanagari digits
+    ],
+)
 def test_invalid_publication_dates(publication_entry, date):
     publication_entry["date"] = date
     with pytest.raises(pydantic.ValidationError):
@@ -586,6 +683,23 @@ def test_sections_without_list():
         data.CurriculumVitae(**input)
 
 
+def test_default_margins_can_be_changed():
+    design = data.RenderCVDataModel(
+        cv={"name": "John Doe"},  # type: ignore
+        design={"theme": "classic"},
+    ).design
+    other_design = data.RenderCVDataModel(
+        cv={"name": "John Doe"},  # type: ignore
+    ).design
+    assert isinstance(design, ClassicThemeOptions)
+    assert isinstance(other_design, ClassicThemeOptions)
+
+    design.margins.page.top = "1 cm"
+
+    assert design.margins.page.top == "1 cm"
+    assert other_design.margins.page.top == "2 cm"
+
+
 @pytest.mark.parametrize(
     "invalid_custom_theme_name",
     [
@@ -612,6 +726,17 @@ def test_custom_theme_with_missing_files(tmp_path):
         )
 
 
+def test_custom_theme_that_is_a_file(tmp_path):
+    custom_theme_path = tmp_path / "customtheme"
+    custom_theme_path.write_text("dummy content", encoding="utf-8")
+    os.chdir(tmp_path)
+    with pytest.raises(pydantic.ValidationError):
+        data.RenderCVDataModel(
+            cv={"name": "John Doe"},  # type: ignore
+            design={"theme": "customtheme"},
+        )
+
+
 def test_custom_theme(testdata_directory_path):
     os.chdir(
         testdata_directory_path
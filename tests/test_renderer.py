@@ -132,6 +132,18 @@ def test_markdown_file_class(tmp_path, rendercv_data_model, jinja2_environment):
             "\\dontEscapeThis{}",
             "\\dontEscapeThis{}",
         ),
+        (
+            "\\textbf{[link_test](https://my_url.com)}",
+            "\\textbf{[link\\_test](https://my_url.com)}",
+        ),
+        (
+            "A & B: \\textbf{100%} of $$a_b$$ in [#1_link](https://my_url.com)",
+            "A \\& B: \\textbf{100%} of $a_b$ in [\\#1\\_link](https://my_url.com)",
+        ),
+        (
+            "\\textit{$$a_b$$} costs $5 & 10%",
+            "\\textit{$a_b$} costs \\$5 \\& 10\\%",
+        ),
     ],
 )
 def test_escape_latex_characters(string, expected_string):